@@ -3,30 +3,110 @@
 # agent.py – Offline Assistant with Eyes, Ears, and Memory
 import os
 import json
-from collections import defaultdict
+import gzip
+import atexit
+from typing import Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Modalities, so Eyes and Ears can share a label without mixing details
+EYES = 0
+EARS = 1
+LEGACY = -1  # pre-modality entries; visible to every modality's recall
+
+MEMORY_FORMAT = 2  # column layout; old label -> details stores carry no marker
 
 class Memory:
-    """Handles storing and recalling of labeled details."""
-    def __init__(self, memory_file="memory.json"):
+    """Handles storing and recalling of labeled details per modality."""
+    COMPRESS_THRESHOLD = 1024  # bytes; smaller stores are written as plain JSON
+
+    def __init__(self, memory_file="memory.json", flush_every=32):
         self.memory_file = memory_file
-        self.data = defaultdict(list)
+        self.flush_every = flush_every
+        # Parallel columns: entry i is (modality[i], labels[i], details[i])
+        self.labels: List[str] = []
+        self.details: List[str] = []
+        self.modality: List[int] = []
+        self.index: Dict[Tuple[int, str], List[int]] = {}
+        self._dirty = False
+        self._writes_since_flush = 0
         self.load()
+        atexit.register(self.flush)
 
     def load(self):
-        if os.path.exists(self.memory_file):
-            with open(self.memory_file, "r") as f:
-                self.data.update(json.load(f))
+        gz_file = self.memory_file + ".gz"
+        if os.path.exists(gz_file):
+            with gzip.open(gz_file, "rb") as f:
+                stored = _loads(f.read())
+        elif os.path.exists(self.memory_file):
+            with open(self.memory_file, "rb") as f:
+                stored = _loads(f.read())
+        else:
+            return
+        if stored.get("format") == MEMORY_FORMAT:
+            columns = zip(stored["modality"], stored["labels"], stored["details"])
+        else:
+            # Old label -> details layout carried no modality; keep it readable by Eyes and Ears
+            columns = ((LEGACY, label, detail) for label, details in stored.items() for detail in details)
+        for modality, label, detail in columns:
+            self._append(modality, label, detail)
 
     def save(self):
-        with open(self.memory_file, "w") as f:
-            json.dump(self.data, f)
-
-    def remember(self, label, detail):
-        self.data[label].append(detail)
-        self.save()
-
-    def recall(self, label):
-        return self.data.get(label, [])
+        payload = _dumps({
+            "format": MEMORY_FORMAT,
+            "labels": self.labels,
+            "details": self.details,
+            "modality": self.modality,
+        })
+        gz_file = self.memory_file + ".gz"
+        if len(payload) > self.COMPRESS_THRESHOLD:
+            with gzip.open(gz_file, "wb", compresslevel=1) as f:
+                f.write(payload)
+            stale = self.memory_file
+        else:
+            with open(self.memory_file, "wb") as f:
+                f.write(payload)
+            stale = gz_file
+        if os.path.exists(stale):
+            os.remove(stale)
+        self._dirty = False
+        self._writes_since_flush = 0
+
+    def flush(self):
+        """Writes pending details to disk, if any."""
+        if self._dirty:
+            self.save()
+
+    def _append(self, modality, label, detail):
+        self.index.setdefault((modality, label), []).append(len(self.details))
+        self.labels.append(label)
+        self.details.append(detail)
+        self.modality.append(modality)
+
+    def remember(self, modality, label, detail):
+        self._append(modality, label, detail)
+        self._dirty = True
+        self._writes_since_flush += 1
+        if self._writes_since_flush >= self.flush_every:
+            self.save()
+
+    def recall(self, modality, label):
+        # Legacy entries predate anything stored per modality, so they come first
+        positions = self.index.get((LEGACY, label), []) + self.index.get((modality, label), [])
+        return [self.details[i] for i in positions]
 
 class Eyes:
     """Handles visual interactions and draws from Memory."""
@@ -34,11 +114,11 @@ class Eyes:
         self.memory = memory
 
     def see(self, label, description):
-        self.memory.remember(label, description)
+        self.memory.remember(EYES, label, description)
         return f"Seen and stored: {label} – {description}"
 
     def visualize(self, label):
-        details = ", ".join(self.memory.recall(label)) or "[no details]"
+        details = ", ".join(self.memory.recall(EYES, label)) or "[no details]"
         return f"Visualizing {label}: {details}"
 
 class Ears:
@@ -47,11 +127,11 @@ class Ears:
         self.memory = memory
 
     def hear(self, label, sound_detail):
-        self.memory.remember(label, sound_detail)
+        self.memory.remember(EARS, label, sound_detail)
         return f"Heard and stored: {label} – {sound_detail}"
 
     def recall_sound(self, label):
-        sounds = ", ".join(self.memory.recall(label)) or "[no sounds]"
+        sounds = ", ".join(self.memory.recall(EARS, label)) or "[no sounds]"
         return f"Recalling sound for {label}: {sounds}"
 
 # --- Sample Workflow ---
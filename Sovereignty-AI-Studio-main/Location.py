@@ -1,9 +1,20 @@
-import subprocess
+import functools
 import os
+import socket
+from pathlib import Path
 
+@functools.lru_cache(maxsize=1)
+def _geo_reader():
+    # Opened once so the mmdb stays mapped for the life of the process
+    import geoip2.database
+    # you run: `pip install geoip2` once
+    return geoip2.database.Reader('geo.mmdb')
+
+@functools.lru_cache(maxsize=1)
 def get_country_code() -> str:
     # Option 1: Carrier SIM (Android only)
     try:
+        import subprocess
         output = subprocess.check_output( ).decode()
         if "Vodafone" in output or "AT&T" in output:
             return "US"
@@ -14,17 +25,19 @@ def get_country_code() -> str:
 
     # Option 2: Offline IP geocode (one-time download)
     if os.path.exists("geo.mmdb"):
-        import geoip2.database
-        # you run: `pip install geoip2` once
-        reader = geoip2.database.Reader('geo.mmdb')
-        import socket
-        ip = socket.gethostbyname(socket.gethostname())
-        response = reader.country(ip)
-        return response.country.iso_code
+        try:
+            reader = _geo_reader()
+        except ImportError:
+            reader = None
+        if reader is not None:
+            ip = socket.gethostbyname(socket.gethostname())
+            response = reader.country(ip)
+            return response.country.iso_code
 
     # Option 3: Ask once, cache
-    if os.path.exists("last_country.txt"):
-        return open("last_country.txt").read().strip()
+    cached = Path("last_country.txt")
+    if cached.exists():
+        return cached.read_text().strip()
 
     # Fallback
     return "US"
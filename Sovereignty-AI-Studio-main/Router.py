@@ -1,6 +1,7 @@
-from typing import Dict
-from .models import ModelEntry
-from .location import get_country_code  # we'll write this
+from typing import Dict, Optional
+from src.models.model_Definitions import ModelEntry
+from src.utils.constance import ModelCategory, CATEGORY_MODELS
+from Location import get_country_code
 
 COMPLIANCE_MAP: Dict = {
     "US": "Grok-DoD-IL5",       # FedRAMP, HIPAA
@@ -13,18 +14,39 @@ COMPLIANCE_MAP: Dict = {
     "BR": "Grok-Regional-EU",   # LGPD → treat like EU
 }
 
-def route_model() -> ModelEntry:
-    country = get_country_code()
-    model_name = COMPLIANCE_MAP.get(country, "Grok-1.5-Pro")  # safe default
-    # Pull live from registry
+# name -> entry, built once from the registry (first occurrence wins)
+_MODEL_INDEX: Dict[str, ModelEntry] = {}
+
+def _build_index() -> None:
+    _MODEL_INDEX.clear()
     for cat in CATEGORY_MODELS.values():
         if isinstance(cat, dict):
             for sublist in cat.values():
                 for m in sublist:
-                    if m.name == model_name:
-                        return m
+                    _MODEL_INDEX.setdefault(m.name, m)
         elif isinstance(cat, list):
             for m in cat:
-                if m.name == model_name:
-                    return m
-    return ModelEntry("fallback", "Safe Local")
+                _MODEL_INDEX.setdefault(m.name, m)
+
+_build_index()
+
+def register_model(model: ModelEntry, category: ModelCategory, group: Optional[str] = None) -> None:
+    """Add a model to the registry and keep the routing index in sync."""
+    # Grouped categories (e.g. SECURITY) need a group; collections are copied, so *_MODELS stay untouched
+    existing = CATEGORY_MODELS.get(category)
+    nested = isinstance(existing, dict) if existing is not None else group is not None
+    if nested:
+        if group is None:
+            raise ValueError(f"{category} is grouped; pass the group to register into")
+        groups = existing or {}
+        CATEGORY_MODELS[category] = {**groups, group: [*groups.get(group, []), model]}
+    else:
+        if group is not None:
+            raise ValueError(f"{category} is not grouped; got group {group!r}")
+        CATEGORY_MODELS[category] = [*(existing or []), model]
+    _MODEL_INDEX.setdefault(model.name, model)
+
+def route_model() -> ModelEntry:
+    country = get_country_code()
+    model_name = COMPLIANCE_MAP.get(country, "Grok-1.5-Pro")  # safe default
+    return _MODEL_INDEX.get(model_name) or ModelEntry("fallback", "Safe Local")
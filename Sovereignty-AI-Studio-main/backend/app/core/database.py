@@ -3,7 +3,18 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
-engine = create_engine(settings.database_url)
+# Pooling only pays off for networked databases; SQLite keeps SQLAlchemy's defaults.
+if settings.database_url.startswith("sqlite"):
+    engine = create_engine(settings.database_url)
+else:
+    engine = create_engine(
+        settings.database_url,
+        pool_size=20,
+        max_overflow=40,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+    )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -1,3 +1,4 @@
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 from app.core.database import engine, Base
 from app.models.user import User
@@ -6,14 +7,24 @@ from app.models.generation import Generation
 from app.models.media import Media
 
 
+def _create_missing_tables():
+    """Create tables with one schema probe instead of a check per table."""
+    existing = set(inspect(engine).get_table_names())
+    required = set(Base.metadata.tables)
+    if required <= existing:
+        return
+    # Only fall back to per-table checks when the schema is partially present.
+    Base.metadata.create_all(bind=engine, checkfirst=bool(existing & required))
+
+
 def init_db():
     """Initialize the database with tables."""
-    Base.metadata.create_all(bind=engine)
+    _create_missing_tables()
 
 
 def create_tables():
     """Create all database tables."""
-    Base.metadata.create_all(bind=engine)
+    _create_missing_tables()
 
 
 def drop_tables():
@@ -3,12 +3,17 @@ import redis
 from app.config import settings
 
 # Single global client — safe for FastAPI lifespan
-redis_client = redis.from_url(
+# Pool sized for concurrent requests; RESP3 needs redis-py >= 5.0
+redis_client = redis.Redis.from_url(
     settings.redis_url,
     decode_responses=True,
     socket_connect_timeout=5,
     socket_timeout=5,
+    socket_keepalive=True,
     retry_on_timeout=True,
+    max_connections=64,
+    health_check_interval=30,
+    protocol=3,
 )
 
 def get_redis() -> redis.Redis:
@@ -4,92 +4,108 @@
 import re
 import argparse
 import json
-import gzip
-from typing import List, Dict
+import io
+from typing import Iterable, List, Dict
 from threading import RLock
 from pathlib import Path
 from datetime import datetime, timezone
 import os
-import shutil
+import sys
+import atexit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    if orjson is not None:
+        # orjson never escapes non-ASCII; only its ASCII output matches json.dumps byte for byte.
+        out = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        if out.isascii():
+            return out
+    return json.dumps(obj, indent=2)
+
+
+_WORD_RE = re.compile(r"[\w']+[.,!?;:]*")
+_SPLIT_RE = re.compile(r"([\w']+)([.,!?;:]*)")
+_BARE_WORD_RE = re.compile(r"[\w']+")
 
 
 class FullScanEngine:
+    # Each syllable runs up to and including a vowel; trailing consonants form the last piece.
+    _SYL_RE = re.compile(r"[^aeiouyAEIOUY]*[aeiouyAEIOUY]|[^aeiouyAEIOUY]+")
+
     def __init__(self):
         self.lock = RLock()
         self.sources: Dict[str, List[str]] = {}
         self.context_maps: Dict[str, Dict[str, int]] = {}
         self.miss_counts: Dict[str, int] = {}
         self.clusters: Dict[str, List[List[str]]] = {}
+        self.last_is_new: Dict[str, bool] = {}
 
-    def ingest(self, source: str, raw: str):
+    def _init_source(self, source: str):
         if source not in self.sources:
             self.sources[source] = []
             self.context_maps[source] = {}
             self.miss_counts[source] = 0
             self.clusters[source] = []
+            self.last_is_new[source] = False
 
-        lines = raw.strip().split('\n')
-        for line in lines:
-            tokens = self.tokenize_syllabic(line)
-            start = len(self.sources[source])
-            self.sources[source].extend(tokens)
-
-            cluster = []
-            for i, tk in enumerate(tokens):
-                cluster.append(tk)
-                if tk not in self.context_maps[source]:
-                    self.context_maps[source][tk] = start + i
-            if cluster:
-                self.clusters[source].append(cluster)
+    def ingest(self, source: str, raw: str):
+        self._init_source(source)
+        for line in raw.strip().split('\n'):
+            self.ingest_line(source, line)
+
+    def ingest_line(self, source: str, line: str):
+        self._init_source(source)
+        self._store_tokens(source, self.tokenize_syllabic(line))
+
+    def bulk_ingest(self, source: str, tokens_per_line: Iterable[List[str]]):
+        self._init_source(source)
+        for tokens in tokens_per_line:
+            self._store_tokens(source, tokens)
+
+    def _store_tokens(self, source: str, tokens: List[str]):
+        src_list = self.sources[source]
+        cmap = self.context_maps[source]
+        start = len(src_list)
+        src_list.extend(tokens)
+
+        # tokenize_syllabic returns a fresh list, so it doubles as this line's cluster
+        if tokens:
+            self.clusters[source].append(tokens)
+        for i, tk in enumerate(tokens):
+            cmap.setdefault(tk, start + i)
+        if tokens:
+            self.last_is_new[source] = cmap[tokens[-1]] == start + len(tokens) - 1
 
     def tokenize_syllabic(self, text: str) -> List[str]:
-        words = re.findall(r"[\w']+[.,!?;:]*", text)
+        words = _WORD_RE.findall(text)
         out = []
         for w in words:
-            m = re.match(r"([\w']+)([.,!?;:]*)", w)
+            m = _SPLIT_RE.match(w)
             if not m:
                 continue
             base, punc = m.groups()
             syls = self.syllabify(base)
             token = ''.join(syls) + (punc or '')
-            out.append(token)
+            out.append(sys.intern(token))
         return out
 
     def syllabify(self, word: str) -> List[str]:
-        vowels = 'aeiouyAEIOUY'
-        if not word:
-            return []
-
-        out = []
-        syl = ''
-        for char in word:
-            syl += char
-            if char in vowels and syl:
-                out.append(syl)
-                syl = ''
-        if syl:
-            out.append(syl)
-        return out
+        return self._SYL_RE.findall(word)
 
     def scan_complete(self, source: str) -> bool:
         if source not in self.sources or not self.sources[source]:
             return False
 
-        full_text = self.sources[source]
-        context_map = self.context_maps[source]
-
-        first = full_text[0]
-        last = full_text[-1]
-        length = len(full_text)
-
-        missing = sum(1 for tok in full_text if tok not in context_map)
-        self.miss_counts[source] = missing
+        # ingest records every token in context_map, so a miss cannot happen; no rescan needed.
+        missing = self.miss_counts.get(source, 0)
 
-        return (
-            missing == 0
-            and context_map.get(first) == 0
-            and context_map.get(last) == length - 1
-        )
+        # The first token always maps to 0; the last must be a first occurrence, tracked at ingest.
+        return missing == 0 and self.last_is_new[source]
 
     def verify_all(self) -> Dict[str, bool]:
         return {source: self.scan_complete(source) for source in self.sources.keys()}
@@ -121,18 +137,54 @@ class FullScanEngine:
         return [" ".join(c[:3]) for c in clusters[:5]]
 
 
+_ROTATE_POOL = None
+
+
+def _rotate_pool():
+    # Created on the first rotation; most runs never rotate.
+    global _ROTATE_POOL
+    if _ROTATE_POOL is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _ROTATE_POOL = ThreadPoolExecutor(max_workers=1)
+        atexit.register(_ROTATE_POOL.shutdown, wait=True)
+    return _ROTATE_POOL
+
+
+def _report_compress_error(rotated_path: str, fut):
+    exc = fut.exception()
+    if exc is not None:
+        print(f"Failed to compress rotated log '{rotated_path}': {exc}", file=sys.stderr)
+
+
+def _compress_rotated(rotated_path: str):
+    # Only paid for when a rotation actually happens.
+    import gzip
+    import shutil
+
+    # Rotated logs are cold data: favour compression speed over ratio.
+    with open(rotated_path, 'rb') as f_in, \
+            io.BufferedWriter(gzip.GzipFile(rotated_path + '.gz', 'wb', compresslevel=1), buffer_size=8192) as f_out:
+        shutil.copyfileobj(f_in, f_out, length=8192)
+    os.remove(rotated_path)
+
+
 def rotate_log_file(log_path: str, max_size: int = 1024 * 1024, compress: bool = True) -> str:
     if os.path.isfile(log_path) and os.path.getsize(log_path) > max_size:
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         rotated_path = f"{log_path}.{timestamp}.bak"
         os.rename(log_path, rotated_path)
         if compress:
-            with open(rotated_path, 'rb') as f_in, gzip.open(rotated_path + '.gz', 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
-            os.remove(rotated_path)
+            fut = _rotate_pool().submit(_compress_rotated, rotated_path)
+            fut.add_done_callback(lambda f: _report_compress_error(rotated_path, f))
     return log_path
 
 
+def _tokenize_file(path: str):
+    engine = FullScanEngine()
+    with open(path, "r", encoding="utf-8") as f:
+        return Path(path).name, [engine.tokenize_syllabic(line.rstrip('\n')) for line in f]
+
+
 def main():
     parser = argparse.ArgumentParser(description="Multi-source syllabic scanner and verifier with clusters.")
     parser.add_argument("files", nargs="+", help="Text files to scan and verify.")
@@ -149,15 +201,25 @@ def main():
 
     engine = FullScanEngine()
 
+    paths = []
     for file_path in args.files:
         path = Path(file_path)
         if not path.is_file():
             print(f"Skipping '{file_path}' — not a file.")
             continue
-
-        with path.open("r", encoding="utf-8") as f:
-            content = f.read()
-            engine.ingest(path.name, content)
+        paths.append(path)
+
+    if len(paths) > 1:
+        # Tokenize files in parallel; merge in argument order so output stays stable.
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+            futures = [pool.submit(_tokenize_file, str(path)) for path in paths]
+            for fut in futures:
+                engine.bulk_ingest(*fut.result())
+    else:
+        for path in paths:
+            with path.open("r", encoding="utf-8") as f:
+                engine.bulk_ingest(path.name, (engine.tokenize_syllabic(line.rstrip('\n')) for line in f))
 
     results = engine.verify_all()
 
@@ -175,27 +237,30 @@ def main():
         total_missing = sum(engine.miss_counts.values())
         total_failures = sum(1 for complete in results.values() if not complete)
 
+        buf = io.StringIO()
+        buf.write("=== Cluster Groups by Count ===\n")
+        for cnt in sorted(cluster_groups):
+            buf.write(f"{cnt} clusters: {', '.join(cluster_groups[cnt])}\n")
+
+        buf.write("=== Verification Results (Clusters First) ===\n")
+        timestamp = datetime.now(timezone.utc).isoformat()
+        for src, complete in results.items():
+            clusters_cnt = engine.cluster_count(src)
+            cluster_str = f"Clusters: {clusters_cnt} | Preview: {engine.cluster_summary(src)}" if args.clusters else ""
+            first_tok = engine.sources[src][0]
+            last_tok = engine.sources[src][-1]
+            checksum = engine.dump(src)
+            tokens = engine.token_count(src)
+            avg_len = engine.avg_syllable_length(src)
+            metrics_str = f" | Tokens: {tokens} | AvgLen: {avg_len:.2f}" if args.metrics else ""
+            status_str = "OK" if complete else f"FAIL ({engine.miss_counts[src]} missing)"
+
+            buf.write(f"[{timestamp}] {src} | {cluster_str} | Status: {status_str} | First: {first_tok} | Last: {last_tok} | Checksum: {checksum}{metrics_str}\n")
+
+        buf.write(f"Summary: {total_failures} failures, {total_missing} total missing syllables\n")
+
         with open(active_log, mode, encoding="utf-8") as log_file:
-            log_file.write("=== Cluster Groups by Count ===\n")
-            for cnt in sorted(cluster_groups):
-                log_file.write(f"{cnt} clusters: {', '.join(cluster_groups[cnt])}\n")
-
-            log_file.write("=== Verification Results (Clusters First) ===\n")
-            for src, complete in results.items():
-                timestamp = datetime.now(timezone.utc).isoformat()
-                clusters_cnt = engine.cluster_count(src)
-                cluster_str = f"Clusters: {clusters_cnt} | Preview: {engine.cluster_summary(src)}" if args.clusters else ""
-                first_tok = engine.sources[src][0]
-                last_tok = engine.sources[src][-1]
-                checksum = engine.dump(src)
-                tokens = engine.token_count(src)
-                avg_len = engine.avg_syllable_length(src)
-                metrics_str = f" | Tokens: {tokens} | AvgLen: {avg_len:.2f}" if args.metrics else ""
-                status_str = "OK" if complete else f"FAIL ({engine.miss_counts[src]} missing)"
-
-                log_file.write(f"[{timestamp}] {src} | {cluster_str} | Status: {status_str} | First: {first_tok} | Last: {last_tok} | Checksum: {checksum}{metrics_str}\n")
-
-            log_file.write(f"Summary: {total_failures} failures, {total_missing} total missing syllables\n")
+            log_file.write(buf.getvalue())
 
     if args.json:
         output = {
@@ -210,7 +275,7 @@ def main():
                 } for src, complete in results.items()
             }
         }
-        print(json.dumps(output, indent=2))
+        print(_dumps(output))
     else:
         for src, complete in results.items():
             if args.clusters:
@@ -229,18 +294,18 @@ if __name__ == "__main__":
 
 
 import argparse
-import json
+import io
 import re
-import gzip
 import os
-import shutil
-from typing import List, Dict
+from typing import Iterable, List, Dict
 from threading import RLock
 from pathlib import Path
 from datetime import datetime, timezone
 
 
 class FullScanEngine:
+    _SYL_RE = re.compile(r"[^aeiou]*[aeiou]+[^aeiou]*", re.I)
+
     def __init__(self, syllable_mode: bool = False):
         self.lock = RLock()
         self.syllable_mode = syllable_mode
@@ -248,64 +313,72 @@ class FullScanEngine:
         self.context_maps: Dict[str, Dict[str, int]] = {}
         self.miss_counts: Dict[str, int] = {}
         self.clusters: Dict[str, List[List[str]]] = {}
+        self.last_is_new: Dict[str, bool] = {}
 
-    def ingest(self, source: str, raw: str):
+    def _init_source(self, source: str):
         if source not in self.sources:
             self.sources[source] = []
             self.context_maps[source] = {}
             self.miss_counts[source] = 0
             self.clusters[source] = []
+            self.last_is_new[source] = False
 
-        lines = raw.strip().split('\n')
-        for line in lines:
-            tokens = self.tokenize_syllabic(line)
-            start = len(self.sources[source])
-            self.sources[source].extend(tokens)
-            cluster = []
-            for i, tk in enumerate(tokens):
-                cluster.append(tk)
-                if tk not in self.context_maps[source]:
-                    self.context_maps[source][tk] = start + i
-            if cluster:
-                self.clusters[source].append(cluster)
+    def ingest(self, source: str, raw: str):
+        self._init_source(source)
+        for line in raw.strip().split('\n'):
+            self.ingest_line(source, line)
+
+    def ingest_line(self, source: str, line: str):
+        self._init_source(source)
+        self._store_tokens(source, self.tokenize_syllabic(line))
+
+    def bulk_ingest(self, source: str, tokens_per_line: Iterable[List[str]]):
+        self._init_source(source)
+        for tokens in tokens_per_line:
+            self._store_tokens(source, tokens)
+
+    def _store_tokens(self, source: str, tokens: List[str]):
+        src_list = self.sources[source]
+        cmap = self.context_maps[source]
+        start = len(src_list)
+        src_list.extend(tokens)
+        # tokenize_syllabic returns a fresh list, so it doubles as this line's cluster
+        if tokens:
+            self.clusters[source].append(tokens)
+        for i, tk in enumerate(tokens):
+            cmap.setdefault(tk, start + i)
+        if tokens:
+            self.last_is_new[source] = cmap[tokens[-1]] == start + len(tokens) - 1
 
     def syllabify(self, word: str) -> List[str]:
-        return re.findall(r"[^aeiou]*[aeiou]+[^aeiou]*", word, re.I)
+        return self._SYL_RE.findall(word)
 
     def tokenize_syllabic(self, text: str) -> List[str]:
         if self.syllable_mode:
-            words = re.findall(r"[\w']+", text)
+            words = _BARE_WORD_RE.findall(text)
             out = []
             for w in words:
                 syls = self.syllabify(w)
-                out.extend(syls)
+                out.extend(map(sys.intern, syls))
             return out
         else:
-            words = re.findall(r"[\w']+[.,!?;:]*", text)
+            words = _WORD_RE.findall(text)
             out = []
             for w in words:
-                m = re.match(r"([\w']+)([.,!?;:]*)", w)
+                m = _SPLIT_RE.match(w)
                 if not m:
                     continue
                 base, punc = m.groups()
-                out.append(base + (punc or ''))
+                out.append(sys.intern(base + (punc or '')))
             return out
 
     def scan_complete(self, source: str) -> bool:
         if source not in self.sources or not self.sources[source]:
             return False
-        full_text = self.sources[source]
-        context_map = self.context_maps[source]
-        first = full_text[0]
-        last = full_text[-1]
-        length = len(full_text)
-        missing = sum(1 for tok in full_text if tok not in context_map)
-        self.miss_counts[source] = missing
-        return (
-            missing == 0
-            and context_map.get(first) == 0
-            and context_map.get(last) == length - 1
-        )
+        # ingest records every token in context_map, so a miss cannot happen; no rescan needed.
+        missing = self.miss_counts.get(source, 0)
+        # The first token always maps to 0; the last must be a first occurrence, tracked at ingest.
+        return missing == 0 and self.last_is_new[source]
 
     def verify_all(self) -> Dict[str, bool]:
         return {source: self.scan_complete(source) for source in self.sources.keys()}
@@ -343,12 +416,17 @@ def rotate_log_file(log_path: str, max_size: int = 1024*1024, compress: bool = T
         rotated_path = f"{log_path}.{timestamp}.bak"
         os.rename(log_path, rotated_path)
         if compress:
-            with open(rotated_path, 'rb') as f_in, gzip.open(rotated_path + '.gz', 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
-            os.remove(rotated_path)
+            fut = _rotate_pool().submit(_compress_rotated, rotated_path)
+            fut.add_done_callback(lambda f: _report_compress_error(rotated_path, f))
     return log_path
 
 
+def _tokenize_file(path: str, syllable_mode: bool = False):
+    engine = FullScanEngine(syllable_mode=syllable_mode)
+    with open(path, "r", encoding="utf-8") as f:
+        return Path(path).name, [engine.tokenize_syllabic(line.rstrip('\n')) for line in f]
+
+
 def parse_cli():
     parser = argparse.ArgumentParser(description="Multi-source syllabic scanner and verifier with clusters.")
     parser.add_argument("files", nargs="+", help="Text files to scan and verify.")
@@ -374,7 +452,7 @@ def init_engine(args) -> FullScanEngine:
 
 
 def generate_json_output(engine: FullScanEngine, results: Dict[str, bool], args) -> str:
-    return json.dumps({
+    return _dumps({
         "tokenization_mode": "syllable" if engine.syllable_mode else "word",
         "clusters": {src: engine.clusters[src] for src in engine.sources} if args.clusters else None,
         "results": {
@@ -386,7 +464,7 @@ def generate_json_output(engine: FullScanEngine, results: Dict[str, bool], args)
                 "avg_syllable_length": engine.avg_syllable_length(src) if args.metrics else None
             } for src, complete in results.items()
         }
-    }, indent=2)
+    })
 
 
 def write_log(engine: FullScanEngine, results: Dict[str, bool], cluster_groups: Dict[int, List[str]], args):
@@ -398,38 +476,53 @@ def write_log(engine: FullScanEngine, results: Dict[str, bool], cluster_groups:
     total_missing = sum(engine.miss_counts.values())
     total_failures = sum(1 for complete in results.values() if not complete)
 
+    buf = io.StringIO()
+    buf.write(f"=== Tokenization Mode: {token_mode} ===\n")
+    buf.write(f"Summary: {total_failures} failures, {total_missing} total missing syllables\n")
+    buf.write("=== Cluster Groups by Count ===\n")
+    for cnt in sorted(cluster_groups):
+        buf.write(f"{cnt} clusters: {', '.join(cluster_groups[cnt])}\n")
+    buf.write("=== Verification Results (Clusters First) ===\n")
+    timestamp = datetime.now(timezone.utc).isoformat()
+    for src, complete in results.items():
+        clusters_cnt = engine.cluster_count(src)
+        cluster_str = f"Clusters: {clusters_cnt} | Preview: {engine.cluster_summary(src)}" if args.clusters else ""
+        first_tok = engine.sources[src][0]
+        last_tok = engine.sources[src][-1]
+        checksum = engine.dump(src)
+        tokens = engine.token_count(src)
+        avg_len = engine.avg_syllable_length(src)
+        metrics_str = f" | Tokens: {tokens} | AvgLen: {avg_len:.2f}" if args.metrics else ""
+        status_str = "OK" if complete else f"FAIL ({engine.miss_counts[src]} missing)"
+        buf.write(f"[{timestamp}] {src} | {cluster_str} | Status: {status_str} | First: {first_tok} | Last: {last_tok} | Checksum: {checksum}{metrics_str}\n")
+
     with open(active_log, mode, encoding="utf-8") as log_file:
-        log_file.write(f"=== Tokenization Mode: {token_mode} ===\n")
-        log_file.write(f"Summary: {total_failures} failures, {total_missing} total missing syllables\n")
-        log_file.write("=== Cluster Groups by Count ===\n")
-        for cnt in sorted(cluster_groups):
-            log_file.write(f"{cnt} clusters: {', '.join(cluster_groups[cnt])}\n")
-        log_file.write("=== Verification Results (Clusters First) ===\n")
-        for src, complete in results.items():
-            timestamp = datetime.now(timezone.utc).isoformat()
-            clusters_cnt = engine.cluster_count(src)
-            cluster_str = f"Clusters: {clusters_cnt} | Preview: {engine.cluster_summary(src)}" if args.clusters else ""
-            first_tok = engine.sources[src][0]
-            last_tok = engine.sources[src][-1]
-            checksum = engine.dump(src)
-            tokens = engine.token_count(src)
-            avg_len = engine.avg_syllable_length(src)
-            metrics_str = f" | Tokens: {tokens} | AvgLen: {avg_len:.2f}" if args.metrics else ""
-            status_str = "OK" if complete else f"FAIL ({engine.miss_counts[src]} missing)"
-            log_file.write(f"[{timestamp}] {src} | {cluster_str} | Status: {status_str} | First: {first_tok} | Last: {last_tok} | Checksum: {checksum}{metrics_str}\n")
+        log_file.write(buf.getvalue())
 
 
 def main():
     args = parse_cli()
     engine = init_engine(args)
 
+    paths = []
     for file_path in args.files:
         path = Path(file_path)
         if not path.is_file():
             print(f"Skipping '{file_path}' — not a file.")
             continue
-        with path.open("r", encoding="utf-8") as f:
-            engine.ingest(path.name, f.read())
+        paths.append(path)
+
+    if len(paths) > 1:
+        # Tokenize files in parallel; merge in argument order so output stays stable.
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+            futures = [pool.submit(_tokenize_file, str(path), engine.syllable_mode) for path in paths]
+            for fut in futures:
+                engine.bulk_ingest(*fut.result())
+    else:
+        for path in paths:
+            with path.open("r", encoding="utf-8") as f:
+                engine.bulk_ingest(path.name, (engine.tokenize_syllabic(line.rstrip('\n')) for line in f))
 
     results = engine.verify_all()
     cluster_groups: Dict[int, List[str]] = {}
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Dict, List, Union
 
-from models import (
+from src.models.model_Definitions import (
     ModelEntry,
     CORE_GROK_MODELS,
     MEDICAL_MODELS,
@@ -0,0 +1,70 @@
+"""Tests for FullScanEngine ingestion and verification in scripts/fullscan_cli.py."""
+import pytest
+
+from scripts.fullscan_cli import FullScanEngine
+
+TEXT = "The rhythm of the boat.\n\nHello there, world!\nLast line here."
+
+
+def state(engine, source):
+    return (
+        engine.sources[source],
+        engine.context_maps[source],
+        engine.clusters[source],
+        engine.verify_all(),
+    )
+
+
+@pytest.mark.parametrize("syllable_mode", [False, True])
+class TestVerifyAll:
+    def test_repeated_last_token_fails(self, syllable_mode):
+        engine = FullScanEngine(syllable_mode=syllable_mode)
+        engine.ingest("doc", "one two\nthree one")
+        assert engine.verify_all() == {"doc": False}
+
+    def test_unique_last_token_passes(self, syllable_mode):
+        engine = FullScanEngine(syllable_mode=syllable_mode)
+        engine.ingest("doc", "one two\nthree four")
+        assert engine.verify_all() == {"doc": True}
+        assert engine.miss_counts["doc"] == 0
+
+    def test_empty_source_fails(self, syllable_mode):
+        engine = FullScanEngine(syllable_mode=syllable_mode)
+        engine.ingest("doc", "")
+        assert engine.verify_all() == {"doc": False}
+
+
+@pytest.mark.parametrize("syllable_mode", [False, True])
+class TestIngestPaths:
+    def test_ingest_line_matches_ingest(self, syllable_mode):
+        whole = FullScanEngine(syllable_mode=syllable_mode)
+        whole.ingest("doc", TEXT)
+        by_line = FullScanEngine(syllable_mode=syllable_mode)
+        for line in TEXT.split("\n"):
+            by_line.ingest_line("doc", line)
+        assert state(by_line, "doc") == state(whole, "doc")
+
+    def test_bulk_ingest_matches_ingest(self, syllable_mode):
+        whole = FullScanEngine(syllable_mode=syllable_mode)
+        whole.ingest("doc", TEXT)
+        bulk = FullScanEngine(syllable_mode=syllable_mode)
+        bulk.bulk_ingest("doc", [bulk.tokenize_syllabic(line) for line in TEXT.split("\n")])
+        assert state(bulk, "doc") == state(whole, "doc")
+
+    def test_paths_agree_when_last_token_repeats(self, syllable_mode):
+        text = "one two\nthree one"
+        whole = FullScanEngine(syllable_mode=syllable_mode)
+        whole.ingest("doc", text)
+        by_line = FullScanEngine(syllable_mode=syllable_mode)
+        for line in text.split("\n"):
+            by_line.ingest_line("doc", line)
+        bulk = FullScanEngine(syllable_mode=syllable_mode)
+        bulk.bulk_ingest("doc", (bulk.tokenize_syllabic(line) for line in text.split("\n")))
+        assert state(whole, "doc") == state(by_line, "doc") == state(bulk, "doc")
+        assert whole.verify_all() == {"doc": False}
+
+    def test_ingest_line_creates_source(self, syllable_mode):
+        engine = FullScanEngine(syllable_mode=syllable_mode)
+        engine.ingest_line("new", "hello")
+        assert engine.token_count("new") > 0
+        assert engine.verify_all() == {"new": True}
@@ -0,0 +1,63 @@
+"""Tests for compliance-based model routing in Router.py."""
+import pytest
+
+import Router
+from src.models.model_Definitions import CORE_GROK_MODELS, ModelEntry
+from src.utils.constance import ModelCategory
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    """Give each test its own registry and index so registrations don't leak."""
+    monkeypatch.setattr(Router, "CATEGORY_MODELS", dict(Router.CATEGORY_MODELS))
+    monkeypatch.setattr(Router, "_MODEL_INDEX", dict(Router._MODEL_INDEX))
+    monkeypatch.setattr(Router, "COMPLIANCE_MAP", dict(Router.COMPLIANCE_MAP))
+
+
+def route_for(monkeypatch, country):
+    monkeypatch.setattr(Router, "get_country_code", lambda: country)
+    return Router.route_model()
+
+
+class TestRouteModel:
+    def test_routes_to_grouped_category_entry(self, monkeypatch):
+        model = route_for(monkeypatch, "US")
+        assert model.name == "Grok-DoD-IL5"
+
+    def test_unknown_country_uses_default_model(self, monkeypatch):
+        model = route_for(monkeypatch, "ZZ")
+        assert model.name == "Grok-1.5-Pro"
+
+    def test_unregistered_model_falls_back(self, monkeypatch):
+        Router.COMPLIANCE_MAP["XX"] = "Grok-Not-Registered"
+        assert route_for(monkeypatch, "XX") == ModelEntry("fallback", "Safe Local")
+
+
+class TestRegisterModel:
+    def test_list_category(self, monkeypatch):
+        entry = ModelEntry("Grok-Test-Core", "Grok Test Core")
+        Router.COMPLIANCE_MAP["XX"] = entry.name
+        core_before = list(CORE_GROK_MODELS)
+
+        Router.register_model(entry, ModelCategory.CORE_GROK)
+
+        assert route_for(monkeypatch, "XX") == entry
+        assert Router.CATEGORY_MODELS[ModelCategory.CORE_GROK][-1] == entry
+        assert CORE_GROK_MODELS == core_before
+
+    def test_grouped_category(self, monkeypatch):
+        entry = ModelEntry("gpt-test", "gpt-test-preview")
+        Router.COMPLIANCE_MAP["XX"] = entry.name
+
+        Router.register_model(entry, ModelCategory.GPT, "GPT-4")
+
+        assert route_for(monkeypatch, "XX") == entry
+        assert Router.CATEGORY_MODELS[ModelCategory.GPT]["GPT-4"][-1] == entry
+
+    def test_group_required_for_grouped_category(self):
+        with pytest.raises(ValueError):
+            Router.register_model(ModelEntry("x", "x"), ModelCategory.SECURITY)
+
+    def test_group_rejected_for_list_category(self):
+        with pytest.raises(ValueError):
+            Router.register_model(ModelEntry("x", "x"), ModelCategory.CORE_GROK, "Compliance")
@@ -0,0 +1,79 @@
+"""Tests for Agent_Eyes Memory storage and legacy-store migration."""
+import gzip
+import json
+import os
+
+import pytest
+
+from Agent_Eyes import EARS, EYES, MEMORY_FORMAT, Ears, Eyes, Memory
+
+
+@pytest.fixture
+def memory_file(tmp_path):
+    return str(tmp_path / "memory.json")
+
+
+def write_legacy(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+class TestLegacyMigration:
+    def test_legacy_entries_visible_to_eyes_and_ears(self, memory_file):
+        write_legacy(memory_file, {"forest": ["birds chirping"], "sunset horizon": ["orange gradient"]})
+        memory = Memory(memory_file)
+
+        assert memory.recall(EYES, "forest") == ["birds chirping"]
+        assert memory.recall(EARS, "forest") == ["birds chirping"]
+        assert Ears(memory).recall_sound("forest") == "Recalling sound for forest: birds chirping"
+        assert Eyes(memory).visualize("sunset horizon") == "Visualizing sunset horizon: orange gradient"
+
+    def test_marker_named_labels_stay_legacy(self, memory_file):
+        write_legacy(memory_file, {"format": ["x"], "modality": ["y"], "labels": ["z"]})
+        memory = Memory(memory_file)
+
+        assert memory.recall(EYES, "format") == ["x"]
+        assert memory.recall(EARS, "modality") == ["y"]
+        assert memory.recall(EYES, "labels") == ["z"]
+
+    def test_save_and_reload_after_migration(self, memory_file):
+        write_legacy(memory_file, {"forest": ["birds chirping"]})
+        memory = Memory(memory_file)
+        memory.remember(EARS, "forest", "wind")
+        memory.remember(EYES, "forest", "green canopy")
+        memory.flush()
+
+        with open(memory_file) as f:
+            assert json.load(f)["format"] == MEMORY_FORMAT
+        reloaded = Memory(memory_file)
+        assert reloaded.recall(EARS, "forest") == ["birds chirping", "wind"]
+        assert reloaded.recall(EYES, "forest") == ["birds chirping", "green canopy"]
+
+    def test_gzip_round_trip_above_threshold(self, memory_file):
+        details = [f"detail {i} " * 8 for i in range(40)]
+        write_legacy(memory_file, {"forest": details})
+        memory = Memory(memory_file)
+        memory.remember(EARS, "forest", "wind")
+        memory.flush()
+
+        gz_file = memory_file + ".gz"
+        assert not os.path.exists(memory_file)
+        with gzip.open(gz_file, "rb") as f:
+            stored = json.loads(f.read())
+        assert stored["format"] == MEMORY_FORMAT
+        assert len(json.dumps(stored)) > Memory.COMPRESS_THRESHOLD
+        reloaded = Memory(memory_file)
+        assert reloaded.recall(EYES, "forest") == details
+        assert reloaded.recall(EARS, "forest") == details + ["wind"]
+
+
+class TestModalities:
+    def test_same_label_kept_apart(self, memory_file):
+        memory = Memory(memory_file)
+        Eyes(memory).see("forest", "green")
+        Ears(memory).hear("forest", "birds")
+        memory.flush()
+
+        reloaded = Memory(memory_file)
+        assert reloaded.recall(EYES, "forest") == ["green"]
+        assert reloaded.recall(EARS, "forest") == ["birds"]